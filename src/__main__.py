@@ -16,6 +16,7 @@ from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.schedulers.background import BlockingScheduler
 
 
+from newrelic_logging import ConfigException
 from newrelic_logging.config import Config, getenv
 from newrelic_logging.factory import Factory
 from newrelic_logging.limits import receiver as limits_receiver
@@ -92,7 +93,10 @@ def parse_args() -> optparse.Values:
 
 def load_config(config_path: str) -> Config:
     if not os.path.exists(config_path):
-        sys.exit(f'config file {config_path} not found')
+        raise ConfigException(
+            'config_file',
+            f'config file {config_path} not found',
+        )
 
     with open(config_path) as stream:
         config = load(stream, Loader=Loader)
@@ -1,3 +1,4 @@
+import orjson
 from requests import RequestException, Session, Response
 from typing import Any
 
@@ -15,11 +16,11 @@ def get(
     url = f'{auth.get_instance_url()}{serviceUrl}'
 
     try:
-        headers = {
-            'Authorization': f'Bearer {auth.get_access_token()}'
-        }
-
-        response = session.get(url, headers=headers, stream=stream)
+        response = session.get(
+            url,
+            headers=auth.get_auth_headers(),
+            stream=stream,
+        )
 
         status_code = response.status_code
 
@@ -32,11 +33,11 @@ def get(
             )
             auth.reauthenticate(session)
 
-            new_headers = {
-                'Authorization': f'Bearer {auth.get_access_token()}'
-            }
-
-            response = session.get(url, headers=new_headers, stream=stream)
+            response = session.get(
+                url,
+                headers=auth.get_auth_headers(),
+                stream=stream,
+            )
             if response.status_code == 200:
                 return cb(response)
 
@@ -64,12 +65,18 @@ def stream_lines(response: Response, chunk_size: int):
 
     # Stream the response as a set of lines. This function will return an
     # iterator that yields one line at a time holding only the minimum
-    # amount of data chunks in memory to make up a single line
+    # amount of data chunks in memory to make up a single line. The
+    # response is closed once all lines have been consumed (or the
+    # generator iterator is closed early) so the underlying connection is
+    # always released back to the pool.
 
-    return response.iter_lines(
-        decode_unicode=True,
-        chunk_size=chunk_size,
-    )
+    try:
+        yield from response.iter_lines(
+            decode_unicode=True,
+            chunk_size=chunk_size,
+        )
+    finally:
+        response.close()
 
 
 class Api:
@@ -91,7 +98,9 @@ class Api:
             self.authenticator,
             session,
             f'/services/data/v{ver}/query?q={soql}',
-            lambda response : response.json()
+            # orjson parses large query result arrays noticeably faster
+            # than response.json()
+            lambda response : orjson.loads(response.content)
         )
 
     def get_log_file(
@@ -117,5 +126,5 @@ class Api:
             self.authenticator,
             session,
             f'/services/data/v{ver}/limits/',
-            lambda response : response.json(),
+            lambda response : orjson.loads(response.content),
         )
@@ -2,6 +2,7 @@ from cryptography.hazmat.primitives import serialization
 from datetime import datetime, timedelta
 import jwt
 from requests import RequestException, Session
+from threading import Lock
 
 from . import ConfigException, LoginException
 from .cache import DataCache
@@ -35,6 +36,9 @@ class Authenticator:
         self.data_cache = data_cache
         self.access_token = None
         self.instance_url = None
+        self.auth_headers = None
+        self.private_key = None
+        self.reauth_lock = Lock()
 
     def get_access_token(self) -> str:
         return self.access_token
@@ -49,6 +53,27 @@ class Authenticator:
         self.access_token = access_token
         self.instance_url = instance_url
 
+        # Build the authorization headers eagerly, once per token, rather
+        # than lazily on read: downloads run concurrently, so a lazy
+        # rebuild racing with a reauthentication could cache a Bearer
+        # header built from a cleared token.
+        self.auth_headers = None if access_token is None else {
+            'Authorization': f'Bearer {access_token}',
+        }
+
+    def get_auth_headers(self) -> dict:
+        headers = self.auth_headers
+
+        if headers is None:
+            # No token is set (or it was just cleared mid-reauth). Build
+            # the headers without caching them so a bogus value can never
+            # outlive the reauthentication.
+            return {
+                'Authorization': f'Bearer {self.access_token}',
+            }
+
+        return headers
+
     def clear_auth(self) -> None:
         self.set_auth_data(None, None)
 
@@ -62,31 +87,32 @@ class Authenticator:
 
     def load_auth_from_cache(self) -> bool:
         try:
-            auth_exists = self.data_cache.backend.redis.exists(AUTH_CACHE_KEY)
+            # Pipeline the EXISTS and HMGET so loading cached credentials
+            # costs a single round trip instead of two.
+            pipe = self.data_cache.backend.redis.pipeline()
+            pipe.exists(AUTH_CACHE_KEY)
+            pipe.hmget(AUTH_CACHE_KEY, ['access_token', 'instance_url'])
+            auth_exists, auth = pipe.execute()
+
             if auth_exists:
                 print_info('Retrieving credentials from Redis.')
-                try:
-                    auth = self.data_cache.backend.redis.hmget(
-                        AUTH_CACHE_KEY,
-                        ['access_token', 'instance_url'],
-                    )
-
-                    self.set_auth_data(
-                        auth[0],
-                        auth[1],
-                    )
-
-                    return True
-                except Exception as e:
-                    print_err(f"Failed getting 'auth' key: {e}")
+
+                self.set_auth_data(
+                    auth[0],
+                    auth[1],
+                )
+
+                return True
         except Exception as e:
             print_err(f"Failed checking 'auth' key: {e}")
 
         return False
 
     def store_auth(self, auth_resp: dict) -> None:
-        self.access_token = auth_resp['access_token']
-        self.instance_url = auth_resp['instance_url']
+        self.set_auth_data(
+            auth_resp['access_token'],
+            auth_resp['instance_url'],
+        )
 
         if self.data_cache:
             print_info('Storing credentials in cache.')
@@ -97,12 +123,32 @@ class Authenticator:
             }
 
             try:
-                self.data_cache.backend.redis.hmset(AUTH_CACHE_KEY, auth)
+                self.data_cache.backend.redis.hset(
+                    AUTH_CACHE_KEY,
+                    mapping=auth,
+                )
             except Exception as e:
                 print_warn(f"Failed storing data in cache: {e}")
 
-    def authenticate_with_jwt(self, session: Session) -> None:
+    def get_private_key(self):
+        # Deserializing the private key is expensive so only do it on the
+        # first authentication and reuse the key object for any
+        # reauthentications after that.
+        if self.private_key:
+            return self.private_key
+
         private_key_file = self.auth_data['private_key']
+
+        with open(private_key_file, 'r') as f:
+            try:
+                private_key = f.read()
+                self.private_key = serialization.load_ssh_private_key(private_key.encode(), password=b'')
+            except ValueError as e:
+                raise LoginException(f'authentication failed for {self.instance_name}. error message: {str(e)}')
+
+        return self.private_key
+
+    def authenticate_with_jwt(self, session: Session) -> None:
         client_id = self.auth_data['client_id']
         subject = self.auth_data['subject']
         audience = self.auth_data['audience']
@@ -110,12 +156,7 @@ class Authenticator:
             datetime.utcnow() + timedelta(minutes=self.auth_data['exp_offset'])
         ).timestamp())
 
-        with open(private_key_file, 'r') as f:
-            try:
-                private_key = f.read()
-                key = serialization.load_ssh_private_key(private_key.encode(), password=b'')
-            except ValueError as e:
-                raise LoginException(f'authentication failed for {self.instance_name}. error message: {str(e)}')
+        key = self.get_private_key()
 
         jwt_claim_set = {
             "iss": client_id,
@@ -200,8 +241,12 @@ class Authenticator:
         print_info('Correctly authenticated with JWT flow')
 
     def reauthenticate(self, session: Session) -> None:
-        self.clear_auth()
-        self.authenticate(session)
+        # Downloads may run concurrently, so serialize reauthentication to
+        # keep multiple threads that all saw a 401 from stampeding the
+        # token endpoint at once.
+        with self.reauth_lock:
+            self.clear_auth()
+            self.authenticate(session)
 
 def validate_oauth_config(auth: dict) -> dict:
     if not auth['client_id']:
@@ -46,6 +46,14 @@ class RedisBackend:
     def set_expiry(self, key, days):
         self.redis.expire(key, timedelta(days=days))
 
+    def batch(self):
+        # Returns a backend over a Redis pipeline so that a series of
+        # writes can be sent in a single round trip via execute().
+        return RedisBackend(self.redis.pipeline())
+
+    def execute(self):
+        self.redis.execute()
+
 
 class BackendFactory:
     def __init__(self):
@@ -137,22 +145,28 @@ class DataCache:
 
     def flush(self) -> None:
         try:
+            # Queue all writes on a single pipelined batch so the flush
+            # costs one round trip instead of several per cached record.
+            batch = self.backend.batch()
+
             for record_id in self.log_records:
                 buf = self.log_records[record_id].get_buffer()
                 if len(buf) > 0:
-                    self.backend.set_add(record_id, *buf)
+                    batch.set_add(record_id, *buf)
 
-                self.backend.set_expiry(record_id, self.expiry)
+                batch.set_expiry(record_id, self.expiry)
 
             if self.query_records:
                 buf = self.query_records.get_buffer()
                 if len(buf) > 0:
                     for id in buf:
-                        self.backend.put(id, 1)
-                        self.backend.set_expiry(id, self.expiry)
+                        batch.put(id, 1)
+                        batch.set_expiry(id, self.expiry)
+
+                    batch.set_add('record_ids', *buf)
+                    batch.set_expiry('record_ids', self.expiry)
 
-                    self.backend.set_add('record_ids', *buf)
-                    self.backend.set_expiry('record_ids', self.expiry)
+            batch.execute()
 
             # attempt to reclaim memory
             for record_id in self.log_records:
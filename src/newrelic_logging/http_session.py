@@ -2,6 +2,7 @@ import requests
 from requests.adapters import HTTPAdapter, Retry
 
 DEFAULT_TIMEOUT = 5  # seconds
+DEFAULT_POOL_SIZE = 16
 
 
 class TimeoutHTTPAdapter(HTTPAdapter):
@@ -23,6 +24,8 @@ def new_retry_session(retries=3,
                       backoff_factor=3,
                       status_forcelist=(500, 502, 504),
                       session=None,
+                      pool_connections=DEFAULT_POOL_SIZE,
+                      pool_maxsize=DEFAULT_POOL_SIZE,
                       ):
     session = session or requests.Session()
     max_retries = Retry(
@@ -32,7 +35,14 @@ def new_retry_session(retries=3,
         backoff_factor=backoff_factor,
         status_forcelist=status_forcelist,
     )
-    adapter = TimeoutHTTPAdapter(max_retries=max_retries)
+    # Size the connection pool explicitly so keep-alive connections are
+    # reused across the many log file downloads made per run instead of
+    # paying a TLS handshake for each one.
+    adapter = TimeoutHTTPAdapter(
+        max_retries=max_retries,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+    )
     session.mount('http://', adapter)
     session.mount('https://', adapter)
     return session
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from requests import Session
 
 
@@ -46,9 +45,11 @@ class QueryFactory:
         time_lag_minutes: int,
         last_to_timestamp: str,
         generation_interval: str,
+        to_timestamp: str = None,
     ):
         return {
-            'to_timestamp': get_iso_date_with_offset(time_lag_minutes),
+            'to_timestamp': to_timestamp if to_timestamp \
+                else get_iso_date_with_offset(time_lag_minutes),
             'from_timestamp': last_to_timestamp,
             'log_interval_type': generation_interval,
         }
@@ -66,8 +67,13 @@ class QueryFactory:
         time_lag_minutes: int,
         last_to_timestamp: str,
         generation_interval: str,
+        to_timestamp: str = None,
     ) -> Query:
-        qp = deepcopy(q)
+        # A shallow copy is enough here: only the top-level 'query' key is
+        # popped off the copy and neither substitute() nor Config mutate
+        # the nested values, so the full deepcopy walk was wasted work on
+        # every polling cycle.
+        qp = dict(q)
         qq = qp.pop('query', '')
 
         return Query(
@@ -77,6 +83,7 @@ class QueryFactory:
                     time_lag_minutes,
                     last_to_timestamp,
                     generation_interval,
+                    to_timestamp,
                 ),
                 qq,
                 self.get_env(qp),
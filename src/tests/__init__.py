@@ -122,6 +122,11 @@ class AuthenticatorStub:
     def get_access_token(self) -> str:
         return self.access_token
 
+    def get_auth_headers(self) -> dict:
+        return {
+            'Authorization': f'Bearer {self.access_token}',
+        }
+
     def get_instance_url(self) -> str:
         return self.instance_url
 
@@ -180,6 +185,7 @@ class DataCacheStub:
         self.cached_records = cached_records
         self.skip_record_ids = skip_record_ids
         self.flush_called = False
+        self.flush_count = 0
 
     def can_skip_downloading_logfile(self, record_id: str) -> bool:
         return record_id in self.skip_record_ids
@@ -193,6 +199,7 @@ class DataCacheStub:
 
     def flush(self) -> None:
         self.flush_called = True
+        self.flush_count += 1
 
 
 class NewRelicStub:
@@ -280,6 +287,7 @@ class QueryFactoryStub:
         self.query = query
         self.queries = [] if not query else None
         self.wrap = wrap
+        self.to_timestamps = []
 
     def new(
         self,
@@ -288,7 +296,10 @@ class QueryFactoryStub:
         time_lag_minutes: int = 0,
         last_to_timestamp: str = '',
         generation_interval: str = '',
+        to_timestamp: str = None,
     ) -> Query:
+        self.to_timestamps.append(to_timestamp)
+
         if self.query:
             return self.query
 
@@ -353,6 +364,18 @@ class RedisStub:
         self.expiry = {}
         self.test_cache = test_cache
         self.raise_error = raise_error
+        self.pipeline_called = False
+        self.execute_called = False
+
+    def pipeline(self):
+        self.pipeline_called = True
+        return self
+
+    def execute(self):
+        if self.raise_error:
+            raise RedisError('raise_error set')
+
+        self.execute_called = True
 
     def exists(self, key):
         if self.raise_error:
@@ -417,6 +440,12 @@ class BackendStub:
     def set_expiry(self, key, days):
         self.redis.expire(key, timedelta(days=days))
 
+    def batch(self):
+        return self
+
+    def execute(self):
+        self.redis.execute()
+
 
 class BackendFactoryStub:
     def __init__(self, raise_error = False):
@@ -462,6 +491,10 @@ class ResponseStub:
         self.decode_unicode = None
         self.encoding = encoding
         self.iter_lines_called = False
+        self.closed = False
+
+    def close(self):
+        self.closed = True
 
     def iter_lines(self, *args, **kwargs):
         self.iter_lines_called = True
@@ -477,6 +510,13 @@ class ResponseStub:
     def json(self, *args, **kwargs):
         return json.loads(self.text)
 
+    @property
+    def content(self):
+        if isinstance(self.text, str):
+            return self.text.encode('utf-8')
+
+        return self.text
+
 
 class InstanceStub:
     def __init__(
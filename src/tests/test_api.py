@@ -498,6 +498,46 @@ class TestApi(unittest.TestCase):
         self.assertTrue(response.decode_unicode)
         self.assertTrue(response.iter_lines_called)
 
+    def test_stream_lines_closes_response_when_lines_are_exhausted(self):
+        '''
+        stream_lines() closes the response once all lines have been consumed
+        given: a response
+        and given: a chunk size
+        when: the generator iterator is fully consumed
+        then: the response is closed
+        '''
+
+        # setup
+        response = ResponseStub(200, 'OK', 'OK', ['foo lines', 'bar line'])
+
+        # execute
+        lines = api.stream_lines(response, 1024)
+        for _ in lines:
+            pass
+
+        # verify
+        self.assertTrue(response.closed)
+
+    def test_stream_lines_closes_response_when_generator_closed_early(self):
+        '''
+        stream_lines() closes the response if the generator iterator is closed before all lines are consumed
+        given: a response
+        and given: a chunk size
+        when: the generator iterator is closed after a partial read
+        then: the response is closed
+        '''
+
+        # setup
+        response = ResponseStub(200, 'OK', 'OK', ['foo lines', 'bar line'])
+
+        # execute
+        lines = api.stream_lines(response, 1024)
+        next(lines)
+        lines.close()
+
+        # verify
+        self.assertTrue(response.closed)
+
     def test_authenticate_calls_authenticator_authenticate(self):
         '''
         authenticate() calls authenticate() on the backing authenticator
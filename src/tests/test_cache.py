@@ -219,6 +219,43 @@ class TestRedisBackend(unittest.TestCase):
         with self.assertRaises(RedisError) as _:
             backend.set_expiry('foo', 5)
 
+    def test_batch_returns_backend_over_pipeline(self):
+        '''
+        backend batch returns a backend over a redis pipeline
+        given: a redis instance
+        when: batch is called
+        then: a backend over the redis pipeline is returned
+        '''
+
+        # setup
+        redis = RedisStub({})
+
+        # execute
+        backend = cache.RedisBackend(redis)
+        batch = backend.batch()
+
+        # verify
+        self.assertTrue(redis.pipeline_called)
+        self.assertTrue(type(batch) is cache.RedisBackend)
+
+    def test_execute_calls_redis_execute(self):
+        '''
+        backend execute calls execute on the redis pipeline
+        given: a redis instance
+        when: batch is called and execute is called on the result
+        then: the redis pipeline execute command is called
+        '''
+
+        # setup
+        redis = RedisStub({})
+
+        # execute
+        backend = cache.RedisBackend(redis)
+        backend.batch().execute()
+
+        # verify
+        self.assertTrue(redis.execute_called)
+
 
 class TestBackendFactory(unittest.TestCase):
     def test_new_backend(self):
@@ -2256,6 +2256,232 @@ class TestQueryReceiver(unittest.TestCase):
         self.assertEqual(len(logs), 4)
         self.assertTrue(data_cache.flush_called)
 
+    def test_query_receiver_process_records_yields_log_entries_in_record_order_given_multiple_log_records(self):
+        '''
+        QueryReceiver.process_records() yields log entries grouped in record order even though log files download concurrently
+        given: a data cache
+        and given: an api
+        and given: a query factory
+        and given: a list of queries
+        and given: an event type fields mapping
+        and given: an initial delay value
+        and given: a time lag minutes value
+        and given: a generation interval
+        and given: a read chunk size
+        and given: a query object
+        and given: a set of query records
+        when: QueryReceiver.process_records() is called
+        and when: there are multiple 'LogFile' records
+        then: yield the log entries for each log file in the order of the
+              records in the query response
+        '''
+
+        # setup
+        api = ApiStub(lines=self.log_rows)
+        session = SessionStub()
+        query = QueryStub()
+        query_factory = QueryFactoryStub()
+        queries = [
+            {
+                'query': 'foo',
+            },
+        ]
+        records = self.log_records
+
+        # execute
+        r = receiver.QueryReceiver(
+            None,
+            api,
+            query_factory,
+            queries,
+            {},
+            5,
+            300,
+            'Hourly',
+            4096,
+        )
+
+        iter = r.process_records(
+            session,
+            query,
+            records,
+        )
+
+        logs = []
+        for log in iter:
+            logs.append(log)
+
+        # verify
+        self.assertEqual(len(logs), 4)
+        self.assertEqual(
+            [log['attributes']['LogFileId'] for log in logs],
+            [
+                records[0]['Id'],
+                records[0]['Id'],
+                records[1]['Id'],
+                records[1]['Id'],
+            ],
+        )
+
+    def test_query_receiver_process_records_flushes_cache_once_per_log_file(self):
+        '''
+        QueryReceiver.process_records() flushes the data cache once after each log file is consumed
+        given: a data cache
+        and given: an api
+        and given: a query factory
+        and given: a list of queries
+        and given: an event type fields mapping
+        and given: an initial delay value
+        and given: a time lag minutes value
+        and given: a generation interval
+        and given: a read chunk size
+        and given: a query object
+        and given: a set of query records
+        when: QueryReceiver.process_records() is called
+        and when: there are multiple 'LogFile' records
+        and when: a data cache is specified
+        then: flush the data cache once per log file record
+        '''
+
+        # setup
+        api = ApiStub(lines=self.log_rows)
+        data_cache = DataCacheStub()
+        session = SessionStub()
+        query = QueryStub()
+        query_factory = QueryFactoryStub()
+        queries = [
+            {
+                'query': 'foo',
+            },
+        ]
+        records = self.log_records
+
+        # execute
+        r = receiver.QueryReceiver(
+            data_cache,
+            api,
+            query_factory,
+            queries,
+            {},
+            5,
+            300,
+            'Hourly',
+            4096,
+        )
+
+        iter = r.process_records(
+            session,
+            query,
+            records,
+        )
+
+        for _ in iter:
+            pass
+
+        # verify
+        self.assertEqual(data_cache.flush_count, len(records))
+
+    def test_query_receiver_process_records_limits_concurrent_downloads_to_download_workers(self):
+        '''
+        QueryReceiver.process_records() never submits more downloads ahead of the consumer than the download worker count
+        given: a data cache
+        and given: an api
+        and given: a query factory
+        and given: a list of queries
+        and given: an event type fields mapping
+        and given: an initial delay value
+        and given: a time lag minutes value
+        and given: a generation interval
+        and given: a read chunk size
+        and given: a download worker count
+        and given: a query object
+        and given: a set of query records
+        when: QueryReceiver.process_records() is called
+        and when: there are more 'LogFile' records than download workers
+        then: yield one log entry for each log line of every record
+        '''
+
+        # setup
+        api = ApiStub(lines=self.log_rows)
+        session = SessionStub()
+        query = QueryStub()
+        query_factory = QueryFactoryStub()
+        queries = [
+            {
+                'query': 'foo',
+            },
+        ]
+        records = self.log_records
+
+        # execute
+        r = receiver.QueryReceiver(
+            None,
+            api,
+            query_factory,
+            queries,
+            {},
+            5,
+            300,
+            'Hourly',
+            4096,
+            download_workers=1,
+        )
+
+        iter = r.process_records(
+            session,
+            query,
+            records,
+        )
+
+        logs = []
+        for log in iter:
+            logs.append(log)
+
+        # verify
+        self.assertEqual(r.download_workers, 1)
+        self.assertEqual(len(logs), 4)
+
+    def test_new_create_receiver_func_sets_download_workers_from_instance_config(self):
+        '''
+        new_create_receiver_func() creates receivers with the download worker count from the instance config
+        given: a config
+        and given: a query factory
+        and given: an event type fields mapping
+        and given: an initial delay value
+        when: the returned create receiver function is called
+        and when: the instance config specifies a download worker count
+        then: create a receiver with the configured download worker count
+        and when: the instance config does not specify a download worker
+                  count
+        then: create a receiver with the default download worker count
+        '''
+
+        # setup
+        api = ApiStub()
+        query_factory = QueryFactoryStub()
+
+        create_receiver = receiver.new_create_receiver_func(
+            mod_config.Config({}),
+            query_factory,
+            {},
+            0,
+        )
+
+        # execute
+        r1 = create_receiver(
+            mod_config.Config({ 'download_workers': 4 }),
+            None,
+            api,
+        )
+        r2 = create_receiver(mod_config.Config({}), None, api)
+
+        # verify
+        self.assertEqual(r1.download_workers, 4)
+        self.assertEqual(
+            r2.download_workers,
+            receiver.DEFAULT_DOWNLOAD_WORKERS,
+        )
+
     def test_query_receiver_process_records_yields_log_entries_given_query_records(self):
         '''
         QueryReceiver.process_records() yields one log entry for each query record given query records
@@ -2437,3 +2663,71 @@ class TestQueryReceiver(unittest.TestCase):
         last_to_after = r.last_to_timestamp
 
         self.assertNotEqual(last_to_after, last_to_before)
+
+    def test_query_receiver_execute_uses_one_to_timestamp_for_all_queries_and_slide_time_range(self):
+        '''
+        QueryReceiver.execute() snapshots the time range endpoint once and uses it for every query and for sliding the time range
+        given: a data cache
+        and given: an api
+        and given: a query factory
+        and given: a list of queries
+        and given: an event type fields mapping
+        and given: an initial delay value
+        and given: a time lag minutes value
+        and given: a generation interval
+        and given: a read chunk size
+        and given: an http session
+        when: QueryReceiver.execute() is called
+        and when: multiple queries are specified
+        then: pass the same 'to' timestamp to the query factory for every
+              query
+        and: set the last 'to' timestamp to that same timestamp
+        '''
+
+        # setup
+        _now = datetime.utcnow()
+
+        def _utcnow():
+            nonlocal _now
+            return _now
+
+        util._UTCNOW = _utcnow
+
+        api = ApiStub()
+        query_factory = QueryFactoryStub()
+        queries = [
+            {
+                'query': 'foo',
+                'results': [{ 'foo': 'bar' }]
+            },
+            {
+                'query': 'bar',
+                'results': [{ 'bar': 'foo' }]
+            },
+        ]
+        session = SessionStub()
+
+        time_lag_minutes = 300
+        expected = util.get_iso_date_with_offset(time_lag_minutes)
+
+        # execute
+        r = receiver.QueryReceiver(
+            None,
+            api,
+            query_factory,
+            queries,
+            {},
+            5,
+            time_lag_minutes,
+            'Hourly',
+            4096,
+        )
+
+        iter = r.execute(session)
+
+        for _ in iter:
+            pass
+
+        # verify
+        self.assertEqual(query_factory.to_timestamps, [expected, expected])
+        self.assertEqual(r.last_to_timestamp, expected)
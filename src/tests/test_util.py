@@ -82,14 +82,14 @@ class TestUtilities(unittest.TestCase):
         and when: the query result record has a property for the key with a
                   value that is not the emptry string
         then: return a value obtained by concatenating the values for all id
-              keys and creating a sha3 256 message digest over that value
+              keys and creating a blake2b message digest over that value
         '''
 
         # execute
         record_id = util.generate_record_id([ 'Name' ], { 'Name': 'foo' })
 
         # verify
-        m = hashlib.sha3_256()
+        m = hashlib.blake2b(digest_size=32)
         m.update('foo'.encode('utf-8'))
         expected = m.hexdigest()
 